@@ -1,4 +1,4 @@
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, render_template, render_template_string, jsonify, request
 import os
 import json
 import time
@@ -14,6 +14,14 @@ import schedule
 from pathlib import Path
 import sys
 import shutil
+import re
+import hashlib
+import signal
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
 
 logging.basicConfig(
@@ -34,13 +42,34 @@ ARTICLES_PER_SOURCE = 6
 SADTALKER_PATH = os.path.join(os.getcwd(), "SadTalker")  
 SADTALKER_OUTPUT_PATH = os.path.join(os.getcwd(), "static", "videos")
 TEMP_DIR = os.path.join(os.getcwd(), "temp")
+FEED_STATE_PATH = os.path.join(TEMP_DIR, "feed_state.json")
+FEED_TIMEOUT = 15
+FEED_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; AINewsAnchor/1.0)"}
+FEED_DISCOVERY_TTL = 24 * 60 * 60
+SITEMAP_INDEX_CHILDREN = 2
+NEWS_SITEMAP_PATHS = ["/news-sitemap.xml", "/sitemap-news.xml", "/sitemap_news.xml"]
+
+# Per-story segment rendering. Each intro/story/outro clip is cached under
+# SEGMENTS_PATH by a hash of its text, so unchanged stories are reused.
+SEGMENTS_PATH = os.path.join(SADTALKER_OUTPUT_PATH, "segments")
+RENDER_WORKERS = 2
+HLS_SEGMENT_SECONDS = 6
+# Fixed for the whole broadcast, as an EVENT playlist may not change it
+HLS_TARGET_DURATION = HLS_SEGMENT_SECONDS + 1
+
+# Render subprocess limits. Child output is kept in a bounded ring buffer per
+# job rather than buffered whole in memory.
+SADTALKER_TIMEOUT = 30 * 60
+FFMPEG_TIMEOUT = 10 * 60
+RENDER_LOG_LINES = 200
+RENDER_JOB_HISTORY = 20
 
 AVATAR_IMAGES = {
     "en": os.path.join(os.getcwd(), "resources", "english_anchor.jpg"),
     "ur": os.path.join(os.getcwd(), "resources", "urdu_anchor.jpg")
 }
 
-for directory in [SADTALKER_OUTPUT_PATH, TEMP_DIR, os.path.join(os.getcwd(), "resources")]:
+for directory in [SADTALKER_OUTPUT_PATH, SEGMENTS_PATH, TEMP_DIR, os.path.join(os.getcwd(), "resources")]:
     os.makedirs(directory, exist_ok=True)
 
 
@@ -56,6 +85,32 @@ news_sources = {
 }
 
 
+# Known RSS/Atom feeds and news sitemaps per source. Sources without an entry
+# are probed for <link rel="alternate"> feeds on their homepage and for news
+# sitemaps via robots.txt and common paths, and only fall back to a full
+# newspaper build() crawl when nothing can be found.
+news_feeds = {
+    "https://www.bbc.com/": [
+        "https://feeds.bbci.co.uk/news/rss.xml"
+    ],
+    "https://edition.cnn.com/": [
+        "http://rss.cnn.com/rss/edition.rss"
+    ],
+    "https://www.geo.tv": [
+        "https://www.geo.tv/rss/1/1"
+    ]
+}
+
+# Cached feed state: ETag/Last-Modified and the last parsed items per feed URL,
+# plus feeds discovered per source with the time they were checked (rediscovered
+# after FEED_DISCOVERY_TTL). Persisted to FEED_STATE_PATH.
+feed_state = {
+    "feeds": {},
+    "discovered": {}
+}
+feed_state_lock = threading.Lock()
+feed_state_save_lock = threading.Lock()
+
 latest_news = {
     "english": [],
     "urdu": []
@@ -66,6 +121,13 @@ latest_videos = {
     "urdu": None
 }
 
+# Live state of render subprocesses, keyed by job ID
+render_jobs = {}
+render_jobs_lock = threading.Lock()
+
+# Limits concurrent SadTalker renders across all broadcasts sharing the GPU
+render_slots = threading.BoundedSemaphore(RENDER_WORKERS)
+
 def check_sadtalker_installation():
     """Check if SadTalker is properly installed"""
     if not os.path.exists(SADTALKER_PATH):
@@ -103,16 +165,290 @@ except Exception as e:
     logger.error(f"Failed to initialize NLP components: {e}")
     sys.exit(1)
 
+def load_feed_state():
+    """Load cached feed state from disk"""
+    if not os.path.exists(FEED_STATE_PATH):
+        return
+    try:
+        with open(FEED_STATE_PATH, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        with feed_state_lock:
+            feed_state["feeds"].update(data.get("feeds", {}))
+            feed_state["discovered"].update(data.get("discovered", {}))
+        logger.info(f"Loaded feed state for {len(feed_state['feeds'])} feeds")
+    except Exception as e:
+        logger.error(f"Failed to load feed state: {e}")
+
+def prune_feed_state():
+    """Drop cached feeds that are no longer configured, discovered or followed.
+
+    Must be called with feed_state_lock held.
+    """
+    active = {feed_url for feed_urls in news_feeds.values() for feed_url in feed_urls}
+    for discovered in feed_state["discovered"].values():
+        if isinstance(discovered, dict):
+            active.update(discovered["feeds"])
+    for feed_url in list(active):
+        for item in feed_state["feeds"].get(feed_url, {}).get("items", []):
+            if item.get('sitemap'):
+                active.add(item['url'])
+
+    for feed_url in list(feed_state["feeds"]):
+        if feed_url not in active:
+            del feed_state["feeds"][feed_url]
+
+def save_feed_state():
+    """Persist cached feed state to disk"""
+    try:
+        # Pipelines for both languages save concurrently; serialize the write
+        # and replace so they never share a half-written temp file
+        with feed_state_save_lock:
+            with feed_state_lock:
+                prune_feed_state()
+                data = json.dumps(feed_state)
+            tmp_path = FEED_STATE_PATH + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, FEED_STATE_PATH)
+    except Exception as e:
+        logger.error(f"Failed to save feed state: {e}")
+
+def parse_feed_date(value):
+    """Parse an RSS (RFC 822) or Atom/sitemap (ISO 8601) date into UTC"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+def _local_name(tag):
+    """Strip the XML namespace from a tag name"""
+    return tag.rsplit('}', 1)[-1]
+
+def _child_text(element, *names):
+    """Return the text of the first direct or nested child matching one of names"""
+    for child in element.iter():
+        if child is not element and _local_name(child.tag) in names and child.text:
+            return child.text.strip()
+    return None
+
+def parse_feed_items(content):
+    """Parse RSS, Atom or sitemap XML into a list of {'url', 'published'} items.
+
+    Entries of a sitemap index are returned with 'sitemap': True.
+    """
+    root = ET.fromstring(content)
+    root_name = _local_name(root.tag)
+    items = []
+
+    if root_name == 'rss' or root_name == 'RDF':
+        for item in root.iter():
+            if _local_name(item.tag) != 'item':
+                continue
+            link = _child_text(item, 'link')
+            if link:
+                published = _child_text(item, 'pubDate', 'date', 'published', 'updated')
+                items.append({'url': link, 'published': published})
+    elif root_name == 'feed':
+        for entry in root:
+            if _local_name(entry.tag) != 'entry':
+                continue
+            link = None
+            for child in entry:
+                if _local_name(child.tag) == 'link' and child.get('rel', 'alternate') == 'alternate':
+                    link = child.get('href')
+                    break
+            if link:
+                published = _child_text(entry, 'published', 'updated')
+                items.append({'url': link, 'published': published})
+    elif root_name == 'urlset':
+        for url_element in root:
+            if _local_name(url_element.tag) != 'url':
+                continue
+            loc = _child_text(url_element, 'loc')
+            if loc:
+                published = _child_text(url_element, 'publication_date', 'lastmod')
+                items.append({'url': loc, 'published': published})
+    elif root_name == 'sitemapindex':
+        for sitemap_element in root:
+            if _local_name(sitemap_element.tag) != 'sitemap':
+                continue
+            loc = _child_text(sitemap_element, 'loc')
+            if loc:
+                published = _child_text(sitemap_element, 'lastmod')
+                items.append({'url': loc, 'published': published, 'sitemap': True})
+    else:
+        raise ValueError(f"Unsupported feed format: {root_name}")
+
+    return items
+
+def fetch_feed(feed_url):
+    """Fetch a feed with a conditional request, returning its cached or fresh items"""
+    with feed_state_lock:
+        cached = dict(feed_state["feeds"].get(feed_url, {}))
+
+    headers = dict(FEED_HEADERS)
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = requests.get(feed_url, headers=headers, timeout=FEED_TIMEOUT)
+    if response.status_code == 304:
+        logger.info(f"Feed not modified: {feed_url}")
+        return cached.get("items", [])
+    response.raise_for_status()
+
+    # Only the newest items are ever used, so only those are cached
+    items = newest_first(parse_feed_items(response.content))[:ARTICLES_PER_SOURCE]
+    with feed_state_lock:
+        feed_state["feeds"][feed_url] = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "items": items
+        }
+    logger.info(f"Fetched {len(items)} items from feed {feed_url}")
+    return items
+
+def newest_first(items):
+    """Sort feed items by publication date, newest first, undated items last"""
+    oldest = datetime.min.replace(tzinfo=timezone.utc)
+    return sorted(items, key=lambda item: parse_feed_date(item['published']) or oldest,
+                  reverse=True)
+
+def find_homepage_feeds(url):
+    """Find RSS/Atom feeds advertised with <link rel="alternate"> on a homepage"""
+    response = requests.get(url, headers=FEED_HEADERS, timeout=FEED_TIMEOUT)
+    response.raise_for_status()
+    feeds = []
+    for tag in re.findall(r'<link\b[^>]*>', response.text, re.IGNORECASE):
+        if not re.search(r'rel=["\']?alternate', tag, re.IGNORECASE):
+            continue
+        if not re.search(r'type=["\']?application/(rss|atom)\+xml', tag, re.IGNORECASE):
+            continue
+        href = re.search(r'href=["\']([^"\']+)["\']', tag, re.IGNORECASE)
+        if href:
+            feeds.append(requests.compat.urljoin(url, href.group(1)))
+    return feeds
+
+def find_news_sitemaps(url):
+    """Find news sitemaps from robots.txt Sitemap: lines or common news sitemap paths"""
+    sitemaps = []
+    try:
+        response = requests.get(requests.compat.urljoin(url, "/robots.txt"),
+                                headers=FEED_HEADERS, timeout=FEED_TIMEOUT)
+        if response.ok:
+            for line in response.text.splitlines():
+                key, _, value = line.partition(':')
+                if key.strip().lower() == 'sitemap' and value.strip():
+                    sitemaps.append(value.strip())
+    except Exception as e:
+        logger.warning(f"Failed to read robots.txt for {url}: {e}")
+
+    news_sitemaps = [sitemap for sitemap in sitemaps if 'news' in sitemap.lower()]
+    if news_sitemaps:
+        return news_sitemaps
+
+    for path in NEWS_SITEMAP_PATHS:
+        sitemap_url = requests.compat.urljoin(url, path)
+        try:
+            response = requests.head(sitemap_url, headers=FEED_HEADERS,
+                                     timeout=FEED_TIMEOUT, allow_redirects=True)
+            if response.ok:
+                return [sitemap_url]
+        except Exception as e:
+            logger.debug(f"No news sitemap at {sitemap_url}: {e}")
+
+    # General sitemaps are usually indexes; the newest children are used
+    return sitemaps
+
+def discover_feeds(url):
+    """Find feeds or news sitemaps for a source, cached for FEED_DISCOVERY_TTL"""
+    with feed_state_lock:
+        cached = feed_state["discovered"].get(url)
+    if isinstance(cached, dict) and time.time() - cached.get("checked", 0) < FEED_DISCOVERY_TTL:
+        return cached["feeds"]
+
+    try:
+        feeds = find_homepage_feeds(url)
+    except Exception as e:
+        # Homepages often block bots; robots.txt and sitemaps may still work
+        logger.warning(f"Homepage feed discovery failed for {url}: {e}")
+        feeds = []
+    if not feeds:
+        feeds = find_news_sitemaps(url)
+    logger.info(f"Discovered {len(feeds)} feeds for {url}")
+
+    with feed_state_lock:
+        feed_state["discovered"][url] = {"feeds": feeds, "checked": time.time()}
+    return feeds
+
+def fetch_feed_articles(feed_url):
+    """Fetch article items from a feed, following the newest children of a sitemap index"""
+    items = fetch_feed(feed_url)
+    sitemaps = [item for item in items if item.get('sitemap')]
+    if not sitemaps:
+        return items
+
+    articles = []
+    for sitemap in newest_first(sitemaps)[:SITEMAP_INDEX_CHILDREN]:
+        try:
+            articles.extend(item for item in fetch_feed(sitemap['url']) if not item.get('sitemap'))
+        except Exception as e:
+            logger.error(f"Failed to fetch sitemap {sitemap['url']}: {e}")
+    return articles
+
+def discover_article_urls(url):
+    """Return the newest article URLs for a source from its feeds, or None if it has none"""
+    configured = news_feeds.get(url)
+    feed_urls = configured or discover_feeds(url)
+    if not feed_urls:
+        return None
+
+    items = {}
+    for feed_url in feed_urls:
+        try:
+            for item in fetch_feed_articles(feed_url):
+                items.setdefault(item['url'], item)
+        except Exception as e:
+            logger.error(f"Failed to fetch feed {feed_url}: {e}")
+
+    if not items and not configured:
+        # Discovered feeds went stale; rediscover on the next run
+        with feed_state_lock:
+            feed_state["discovered"].pop(url, None)
+    save_feed_state()
+
+    if not items:
+        return None
+
+    return [item['url'] for item in newest_first(items.values())[:ARTICLES_PER_SOURCE]]
+
 def extract_articles(urls):
     """Extract articles from news sources"""
     articles = []
     for url in urls:
         try:
             logger.info(f"Scraping from {url}")
-            paper = build(url, memoize_articles=False)
-            logger.info(f"Found {len(paper.articles)} articles from {url}")
+            article_urls = discover_article_urls(url)
+            if article_urls is not None:
+                logger.info(f"Found {len(article_urls)} articles in feeds for {url}")
+                candidates = [Article(article_url) for article_url in article_urls]
+            else:
+                logger.info(f"No feeds for {url}, falling back to full crawl")
+                paper = build(url, memoize_articles=False)
+                logger.info(f"Found {len(paper.articles)} articles from {url}")
+                candidates = paper.articles[:ARTICLES_PER_SOURCE]
             
-            for article in paper.articles[:ARTICLES_PER_SOURCE]:
+            for article in candidates:
                 try:
                     article.download()
                     time.sleep(1)
@@ -182,24 +518,22 @@ def translate_content(text, target_lang):
         logger.error(f"Translation failed: {e}")
         return text
 
-def create_news_script(news_items, lang='en'):
-    """Create a news script from news items"""
+def create_news_segments(news_items, lang='en'):
+    """Split a news broadcast into intro, per-story and outro script segments"""
     if lang == 'en':
-        script = "Welcome to today's news broadcast.\n\n"
+        segments = ["Welcome to today's news broadcast."]
         for item in news_items[:5]:  # Limit to 5 news items
-            script += f"Breaking news: {item['title']}\n"
-            script += f"{item['summary']}\n\n"
-        script += "Thank you for watching. Stay tuned for more updates."
+            segments.append(f"Breaking news: {item['title']}\n{item['summary']}")
+        segments.append("Thank you for watching. Stay tuned for more updates.")
     else:  # Urdu
-        script = "آج کی خبروں میں خوش آمدید۔\n\n"
+        segments = ["آج کی خبروں میں خوش آمدید۔"]
         for item in news_items[:5]:
             title_ur = translate_content(item['title'], 'ur')
             summary_ur = translate_content(item['summary'], 'ur')
-            script += f"اہم خبر: {title_ur}\n"
-            script += f"{summary_ur}\n\n"
-        script += "دیکھنے کا شکریہ۔ مزید اپڈیٹس کے لیے ہمارے ساتھ رہیں۔"
+            segments.append(f"اہم خبر: {title_ur}\n{summary_ur}")
+        segments.append("دیکھنے کا شکریہ۔ مزید اپڈیٹس کے لیے ہمارے ساتھ رہیں۔")
     
-    return script.strip()
+    return segments
 
 def generate_audio_from_text(text, output_path, lang='en'):
     """Generate audio file from text using TTS"""
@@ -239,8 +573,333 @@ def generate_audio_from_text(text, output_path, lang='en'):
         logger.error(f"All TTS methods failed: {e}")
         return None
 
-def create_avatar_video(script, lang='en'):
-    """Create avatar video using SadTalker"""
+TQDM_PROGRESS = re.compile(r'^\s*(?P<stage>[^|]*?)[:\s]*\d+%\|.*?\|\s*(?P<done>\d+)/(?P<total>\d+)')
+FFMPEG_DURATION = re.compile(r'Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)')
+
+# SadTalker's tqdm stages in run order, with their rough share of render time.
+# Each bar restarts at 0, so these map stage progress onto overall progress.
+SADTALKER_STAGES = [
+    ("landmark det", 0.03),
+    ("3dmm extraction", 0.05),
+    ("mel", 0.01),
+    ("audio2exp", 0.03),
+    ("face renderer", 0.45),
+    ("seamlessclone", 0.08),
+    ("face enhancer", 0.35)
+]
+
+def parse_sadtalker_progress(line, job):
+    """Update a job from SadTalker's tqdm progress bars.
+
+    stage_progress follows the current bar; progress is the overall estimate
+    from SADTALKER_STAGES and never goes backwards.
+    """
+    match = TQDM_PROGRESS.search(line)
+    if not match:
+        return
+    done = int(match.group('done'))
+    total = int(match.group('total'))
+    stage = match.group('stage').strip() or None
+    stage_progress = done / total if total else 0.0
+    job['stage'] = stage
+    job['frames'] = done
+    job['total_frames'] = total
+    job['stage_progress'] = stage_progress
+    
+    completed = 0.0
+    for name, weight in SADTALKER_STAGES:
+        if stage and stage.lower().startswith(name):
+            overall = completed + weight * stage_progress
+            job['progress'] = max(job['progress'] or 0.0, min(overall, 1.0))
+            return
+        completed += weight
+
+def parse_ffmpeg_progress(line, job):
+    """Update a job from ffmpeg's banner and -progress key=value output"""
+    match = FFMPEG_DURATION.search(line)
+    if match and 'duration' not in job:
+        hours, minutes, seconds = match.groups()
+        job['duration'] = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+        return
+    
+    key, _, value = line.partition('=')
+    if key == 'frame' and value.isdigit():
+        job['frames'] = int(value)
+    elif key == 'out_time_us' and value.isdigit() and job.get('duration'):
+        job['progress'] = min(1.0, int(value) / 1e6 / job['duration'])
+    elif key == 'progress' and value == 'end':
+        job['progress'] = 1.0
+
+def terminate_process_group(process, grace=10):
+    """Terminate a render subprocess and all of its children"""
+    def send(sig):
+        try:
+            if hasattr(os, 'killpg'):
+                os.killpg(process.pid, sig)
+            elif sig == signal.SIGTERM:
+                process.terminate()
+            else:
+                process.kill()
+        except ProcessLookupError:
+            pass
+    
+    send(signal.SIGTERM)
+    try:
+        process.wait(timeout=grace)
+    except subprocess.TimeoutExpired:
+        logger.warning(f"Process {process.pid} ignored SIGTERM, killing it")
+        send(getattr(signal, 'SIGKILL', signal.SIGTERM))
+        process.wait()
+
+def prune_render_jobs():
+    """Drop the oldest finished jobs beyond RENDER_JOB_HISTORY"""
+    with render_jobs_lock:
+        finished = [job_id for job_id, job in render_jobs.items() if job['status'] != 'running']
+        for job_id in finished[:-RENDER_JOB_HISTORY]:
+            del render_jobs[job_id]
+
+def run_render_command(command, job_id, timeout, cwd=None, parse_progress=None):
+    """Run a render subprocess, streaming its output and tracking progress.
+
+    Output lines go to the log and to the job's ring buffer as they arrive.
+    Returns the exit code, or None if the process timed out and was killed.
+    """
+    job = {
+        'status': 'running',
+        'stage': None,
+        'progress': None,
+        'started': time.time(),
+        'output': deque(maxlen=RENDER_LOG_LINES)
+    }
+    with render_jobs_lock:
+        render_jobs[job_id] = job
+    
+    logger.info(f"[{job_id}] Running: {' '.join(command)}")
+    
+    def read_output(process):
+        # Universal newlines split tqdm's carriage-return updates into lines.
+        # The reader owns the pipe and closes it once it reaches EOF.
+        try:
+            for line in process.stdout:
+                line = line.rstrip()
+                if not line:
+                    continue
+                logger.debug(f"[{job_id}] {line}")
+                with render_jobs_lock:
+                    job['output'].append(line)
+                    if parse_progress:
+                        parse_progress(line, job)
+        finally:
+            process.stdout.close()
+    
+    process = None
+    returncode = None
+    status = 'failed'
+    try:
+        # Own process group so a timeout can take down the whole process tree
+        process = subprocess.Popen(
+            command,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            bufsize=1,
+            start_new_session=True,
+            # Python children (SadTalker) otherwise block-buffer a piped stdout
+            env={**os.environ, "PYTHONUNBUFFERED": "1"}
+        )
+        
+        reader = threading.Thread(target=read_output, args=(process,), daemon=True)
+        reader.start()
+        
+        try:
+            returncode = process.wait(timeout=timeout)
+            status = 'done' if returncode == 0 else 'failed'
+        except subprocess.TimeoutExpired:
+            logger.error(f"[{job_id}] Timed out after {timeout}s, terminating")
+            terminate_process_group(process)
+            status = 'timeout'
+        finally:
+            reader.join(timeout=5)
+            if reader.is_alive():
+                logger.warning(f"[{job_id}] Output reader still running after exit")
+    finally:
+        # Never leave a job "running" or a child behind, even if Popen or wait raised
+        if process is not None and process.poll() is None:
+            terminate_process_group(process)
+        with render_jobs_lock:
+            job['status'] = status
+            if status == 'done':
+                job['progress'] = 1.0
+            job['finished'] = time.time()
+            tail = list(job['output'])[-20:]
+        prune_render_jobs()
+    
+    if returncode != 0:
+        logger.error(f"[{job_id}] Render {status} (exit code {returncode}), last output:\n" + "\n".join(tail))
+    return returncode
+
+def render_job_status():
+    """Summarize render jobs for the status API"""
+    with render_jobs_lock:
+        return [{
+            'id': job_id,
+            'status': job['status'],
+            'stage': job['stage'],
+            'progress': round(job['progress'], 3) if job['progress'] is not None else None,
+            'stage_progress': round(job['stage_progress'], 3) if job.get('stage_progress') is not None else None,
+            'frames': job.get('frames'),
+            'total_frames': job.get('total_frames'),
+            'elapsed': round(job.get('finished', time.time()) - job['started'], 1),
+            'last_output': job['output'][-1] if job['output'] else None
+        } for job_id, job in render_jobs.items()]
+
+def segment_key(text, lang):
+    """Cache key for a rendered segment: language, avatar image and script text"""
+    digest = hashlib.sha256(f"{lang}\n{AVATAR_IMAGES[lang]}\n{text}".encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+def read_playlist_entries(playlist_path):
+    """Read (duration, uri) pairs from a media playlist written by ffmpeg"""
+    entries = []
+    duration = None
+    with open(playlist_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("#EXTINF:"):
+                duration = float(line[len("#EXTINF:"):].split(',', 1)[0])
+            elif line and not line.startswith("#") and duration is not None:
+                entries.append((duration, line))
+                duration = None
+    return entries
+
+def render_segment(text, lang='en'):
+    """Render one script segment with SadTalker and package it as HLS chunks.
+
+    Returns the segment's playlist path, reusing a cached render when the same
+    text was rendered before.
+    """
+    key = segment_key(text, lang)
+    segment_dir = os.path.join(SEGMENTS_PATH, key)
+    playlist_path = os.path.join(segment_dir, "segment.m3u8")
+    if os.path.exists(playlist_path):
+        logger.info(f"Reusing cached segment {key}")
+        return playlist_path
+    
+    render_id = f"{key}_{uuid.uuid4().hex[:8]}"
+    work_dir = os.path.join(TEMP_DIR, f"render_{render_id}")
+    os.makedirs(work_dir, exist_ok=True)
+    
+    try:
+        # Generate audio from script
+        audio_path = os.path.join(work_dir, "audio.mp3")
+        logger.info(f"Generating audio for {lang} segment {key}")
+        audio_file = generate_audio_from_text(text, audio_path, lang)
+        if not audio_file or not os.path.exists(audio_file):
+            logger.error(f"Audio generation failed for segment {key}")
+            return None
+        
+        command = [
+            sys.executable,  # Use the current Python interpreter
+            "inference.py",
+            "--driven_audio", audio_file,
+            "--source_image", AVATAR_IMAGES[lang],
+            "--result_dir", work_dir,
+            "--enhancer", "gfpgan",
+            "--still",
+            "--preprocess", "full",
+            "--expression_scale", "1.0"
+        ]
+        
+        # Run from the SadTalker directory without changing the process-wide
+        # working directory, so several segments can render in parallel
+        with render_slots:
+            returncode = run_render_command(command, f"sadtalker_{render_id}", SADTALKER_TIMEOUT,
+                                            cwd=SADTALKER_PATH, parse_progress=parse_sadtalker_progress)
+        if returncode != 0:
+            logger.error(f"SadTalker failed for segment {key} with return code {returncode}")
+            return None
+        
+        # Find the output video file
+        video_files = list(Path(work_dir).rglob("*.mp4"))
+        if not video_files:
+            logger.error(f"No output video found in {work_dir}")
+            logger.debug(f"Files in output directory: {os.listdir(work_dir)}")
+            return None
+        
+        # Package the clip as HLS chunks with keyframes on chunk boundaries
+        hls_dir = os.path.join(work_dir, "hls")
+        os.makedirs(hls_dir, exist_ok=True)
+        command = [
+            "ffmpeg", "-y",
+            "-nostats", "-progress", "pipe:1",
+            "-i", str(video_files[0]),
+            "-c:v", "libx264",
+            "-c:a", "aac",
+            "-force_key_frames", f"expr:gte(t,n_forced*{HLS_SEGMENT_SECONDS})",
+            "-f", "hls",
+            "-hls_time", str(HLS_SEGMENT_SECONDS),
+            "-hls_playlist_type", "vod",
+            "-hls_segment_filename", os.path.join(hls_dir, "chunk_%03d.ts"),
+            os.path.join(hls_dir, "segment.m3u8")
+        ]
+        returncode = run_render_command(command, f"hls_{render_id}", FFMPEG_TIMEOUT,
+                                        parse_progress=parse_ffmpeg_progress)
+        if returncode != 0:
+            logger.error(f"HLS packaging failed for segment {key}")
+            return None
+        
+        # Publish the finished segment atomically into the cache
+        try:
+            os.rename(hls_dir, segment_dir)
+        except OSError:
+            if not os.path.exists(playlist_path):
+                raise
+            logger.info(f"Segment {key} was rendered concurrently, using existing copy")
+        
+        logger.info(f"Segment {key} rendered")
+        return playlist_path
+        
+    except Exception as e:
+        logger.exception(f"Error rendering segment {key}: {e}")
+        return None
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+def write_broadcast_playlist(playlist_path, entries, complete=False):
+    """Write the broadcast HLS playlist from (duration, uri, discontinuity) entries"""
+    lines = [
+        "#EXTM3U",
+        "#EXT-X-VERSION:3",
+        "#EXT-X-PLAYLIST-TYPE:EVENT",
+        f"#EXT-X-TARGETDURATION:{HLS_TARGET_DURATION}",
+        "#EXT-X-MEDIA-SEQUENCE:0",
+        # Start at the beginning rather than the live edge while segments are still rendering
+        "#EXT-X-START:TIME-OFFSET=0"
+    ]
+    for duration, uri, discontinuity in entries:
+        if discontinuity:
+            lines.append("#EXT-X-DISCONTINUITY")
+        lines.append(f"#EXTINF:{duration:.3f},")
+        lines.append(uri)
+    if complete:
+        lines.append("#EXT-X-ENDLIST")
+    
+    tmp_path = playlist_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(tmp_path, playlist_path)
+
+def create_avatar_video(segments, lang='en', on_ready=None):
+    """Create an avatar broadcast from script segments using SadTalker.
+
+    Segments render in parallel and are appended to an HLS playlist in order
+    as they finish; on_ready is called with the playlist URL once the first
+    segment is playable.
+    """
     if not check_sadtalker_installation():
         logger.error("SadTalker not properly installed. Video creation aborted.")
         return None
@@ -249,90 +908,58 @@ def create_avatar_video(script, lang='en'):
         logger.error("Avatar images not found. Video creation aborted.")
         return None
     
+    entries = []
     try:
-        # Create a unique ID for this video
+        # Create a unique ID for this broadcast
         video_id = str(uuid.uuid4())
-        
-        # Define paths
-        audio_path = os.path.join(TEMP_DIR, f"audio_{video_id}.mp3")
         output_dir = os.path.join(SADTALKER_OUTPUT_PATH, video_id)
         os.makedirs(output_dir, exist_ok=True)
+        playlist_path = os.path.join(output_dir, "playlist.m3u8")
+        video_url = f"/static/videos/{video_id}/playlist.m3u8"
         
-        source_image = AVATAR_IMAGES[lang]
-        if not os.path.exists(source_image):
-            logger.error(f"Source image not found: {source_image}")
-            return None
-        
-        # Generate audio from script
-        logger.info(f"Generating audio for {lang} script")
-        audio_file = generate_audio_from_text(script, audio_path, lang)
-        if not audio_file or not os.path.exists(audio_file):
-            logger.error("Audio generation failed")
-            return None
-            
-        logger.info(f"Audio file created: {audio_file}")
-        
-        # here we go
-        original_dir = os.getcwd()
-        try:
-            os.chdir(SADTALKER_PATH)
-            logger.info(f"Changed directory to {SADTALKER_PATH}")
-            
-            # Build the command with proper quoting and path handling
-            command = [
-                sys.executable,  # Use the current Python interpreter
-                "inference.py",
-                "--driven_audio", audio_file,
-                "--source_image", source_image,
-                "--result_dir", output_dir,
-                "--enhancer", "gfpgan",
-                "--still",
-                "--preprocess", "full",
-                "--expression_scale", "1.0"
-            ]
-            
-            command_str = " ".join(command)
-            logger.info(f"Running SadTalker command: {command_str}")
+        published = False
+        with ThreadPoolExecutor(max_workers=RENDER_WORKERS) as executor:
+            futures = [executor.submit(render_segment, text, lang) for text in segments]
             
-            # Run the command with full output capture
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            
-            stdout, stderr = process.communicate()
-            
-            # Log the output
-            logger.info(f"SadTalker stdout: {stdout}")
-            if stderr:
-                logger.error(f"SadTalker stderr: {stderr}")
-            
-            if process.returncode != 0:
-                logger.error(f"SadTalker failed with return code {process.returncode}")
-                return None
+            # Publish segments in broadcast order as each one becomes available
+            for index, future in enumerate(futures):
+                segment_playlist = future.result()
+                if not segment_playlist:
+                    logger.warning(f"Skipping segment {index} of {video_id}")
+                    continue
                 
-            # Find the output video file
-            video_files = list(Path(output_dir).glob("*.mp4"))
-            if not video_files:
-                logger.error(f"No output video found in {output_dir}")
-                # List all files in the directory for debugging
-                logger.debug(f"Files in output directory: {os.listdir(output_dir)}")
-                return None
+                segment_dir = os.path.basename(os.path.dirname(segment_playlist))
+                for chunk_index, (duration, uri) in enumerate(read_playlist_entries(segment_playlist)):
+                    if round(duration) > HLS_TARGET_DURATION:
+                        logger.warning(f"Chunk {uri} of segment {segment_dir} lasts {duration:.3f}s, "
+                                       f"over the {HLS_TARGET_DURATION}s target duration")
+                    discontinuity = bool(entries) and chunk_index == 0
+                    entries.append((duration, f"../segments/{segment_dir}/{uri}", discontinuity))
+                write_broadcast_playlist(playlist_path, entries)
+                logger.info(f"Published segment {index + 1}/{len(segments)} to {video_url}")
                 
-            # Get the relative URL path for the video
-            video_url = f"/static/videos/{video_id}/{video_files[0].name}"
-            logger.info(f"Video created successfully: {video_url}")
-            return video_url
-            
-        finally:
-            os.chdir(original_dir)
-            logger.info(f"Changed directory back to {original_dir}")
+                if on_ready and not published:
+                    on_ready(video_url)
+                published = True
+        
+        if not entries:
+            logger.error(f"No segments rendered for {video_id}")
+            return None
+        
+        logger.info(f"Video created successfully: {video_url}")
+        return video_url
             
     except Exception as e:
         logger.exception(f"Error creating video: {e}")
         return None
+    finally:
+        # End the playlist even on failure, so players stop polling a
+        # published partial broadcast
+        if entries:
+            try:
+                write_broadcast_playlist(playlist_path, entries, complete=True)
+            except Exception as e:
+                logger.error(f"Failed to finalize playlist {playlist_path}: {e}")
 
 def fetch_news_pipeline(lang='en'):
     """Run the complete news fetching and processing pipeline"""
@@ -357,17 +984,25 @@ def fetch_news_pipeline(lang='en'):
         logger.warning("No real news passed the filter.")
         return None
     
-    # Create news script
-    script = create_news_script(authentic, lang)
-    logger.info(f"Script ready for {lang}")
+    # Create news script segments
+    segments = create_news_segments(authentic, lang)
+    logger.info(f"Script ready for {lang} ({len(segments)} segments)")
+    
+    lang_key = 'english' if lang == 'en' else 'urdu'
+    
+    def publish(video_url):
+        # Serve the broadcast as soon as its first segment is playable
+        latest_news[lang_key] = authentic
+        latest_videos[lang_key] = video_url
     
     # Create avatar video
-    video_url = create_avatar_video(script, lang)
+    video_url = create_avatar_video(segments, lang, on_ready=publish)
     
-    # Update latest news storage
-    lang_key = 'english' if lang == 'en' else 'urdu'
-    latest_news[lang_key] = authentic
-    latest_videos[lang_key] = video_url
+    # Update latest news storage, keeping an already published partial broadcast
+    # if rendering failed later on
+    if video_url or latest_videos[lang_key] is None:
+        latest_news[lang_key] = authentic
+        latest_videos[lang_key] = video_url
     
     return video_url
 
@@ -413,7 +1048,8 @@ def create_fallback_video(script, lang='en'):
         text_color = "white"
         
         command = [
-            "ffmpeg",
+            "ffmpeg", "-y",
+            "-nostats", "-progress", "pipe:1",
             "-f", "lavfi",
             "-i", f"color=c={background_color}:s=1280x720:d=60",
             "-i", audio_file,
@@ -424,7 +1060,11 @@ def create_fallback_video(script, lang='en'):
             output_path
         ]
         
-        subprocess.run(command, check=True)
+        returncode = run_render_command(command, f"fallback_{video_id}", FFMPEG_TIMEOUT,
+                                        parse_progress=parse_ffmpeg_progress)
+        if returncode != 0:
+            logger.error("ffmpeg failed to create fallback video")
+            return None
         
         if os.path.exists(output_path):
             video_url = f"/static/videos/{video_id}/news_video.mp4"
@@ -476,14 +1116,15 @@ def status():
         "english_news_count": len(latest_news["english"]),
         "urdu_news_count": len(latest_news["urdu"]),
         "english_video": latest_videos["english"] is not None,
-        "urdu_video": latest_videos["urdu"] is not None
+        "urdu_video": latest_videos["urdu"] is not None,
+        "render_jobs": render_job_status()
     })
 
 # HTML template for testing
 @app.route('/test')
 def test_page():
     """Test page to check if videos are working"""
-    return """
+    return render_template_string("""
     <!DOCTYPE html>
     <html>
     <head>
@@ -516,14 +1157,27 @@ def test_page():
             <button onclick="checkStatus()">Refresh Status</button>
         </div>
         
+        <script src="{{ url_for('static', filename='js/hls.js') }}"></script>
         <script>
+            function showVideo(containerId, url) {
+                const container = document.getElementById(containerId);
+                container.innerHTML = '<video controls></video>';
+                const video = container.querySelector('video');
+                if (window.Hls && Hls.isSupported()) {
+                    const hls = new Hls({startPosition: 0});
+                    hls.loadSource(url);
+                    hls.attachMedia(video);
+                } else {
+                    video.src = url;
+                }
+            }
+            
             function loadVideos() {
                 fetch('/api/news/english')
                     .then(response => response.json())
                     .then(data => {
                         if (data.video_url) {
-                            document.getElementById('english-video').innerHTML = 
-                                `<video controls><source src="${data.video_url}" type="video/mp4"></video>`;
+                            showVideo('english-video', data.video_url);
                         }
                     });
                     
@@ -531,8 +1185,7 @@ def test_page():
                     .then(response => response.json())
                     .then(data => {
                         if (data.video_url) {
-                            document.getElementById('urdu-video').innerHTML = 
-                                `<video controls><source src="${data.video_url}" type="video/mp4"></video>`;
+                            showVideo('urdu-video', data.video_url);
                         }
                     });
             }
@@ -566,7 +1219,7 @@ def test_page():
         </script>
     </body>
     </html>
-    """
+    """)
 
 if __name__ == '__main__':
     # Check if SadTalker is installed
@@ -577,6 +1230,8 @@ if __name__ == '__main__':
     if not check_avatar_images():
         logger.warning("Avatar images not found. Using default images may fail.")
     
+    load_feed_state()
+    
     # Initial news fetch in background
     logger.info("Starting initial news fetch")
     threading.Thread(target=fetch_news_pipeline, args=('en',)).start()
@@ -16,6 +16,7 @@ document.addEventListener('DOMContentLoaded', function() {
     
     // State
     let currentLanguage = 'english';
+    let hls = null;
     
     // Initialize
     fetchNews();
@@ -94,8 +95,7 @@ document.addEventListener('DOMContentLoaded', function() {
             .then(data => {
                 if (data.video_url) {
                     // Update video source
-                    videoSource.src = data.video_url;
-                    videoElement.load();
+                    loadVideo(data.video_url);
                     
                     // Update headlines
                     updateHeadlines(data.news);
@@ -113,6 +113,26 @@ document.addEventListener('DOMContentLoaded', function() {
             });
     }
     
+    function loadVideo(url) {
+        if (hls) {
+            hls.destroy();
+            hls = null;
+        }
+        
+        // Broadcasts are HLS playlists that grow while later stories render
+        if (url.endsWith('.m3u8') && window.Hls && Hls.isSupported()) {
+            videoSource.removeAttribute('src');
+            // Start from the intro even while later stories are still being appended
+            hls = new Hls({startPosition: 0});
+            hls.loadSource(url);
+            hls.attachMedia(videoElement);
+        } else {
+            videoSource.type = url.endsWith('.m3u8') ? 'application/vnd.apple.mpegurl' : 'video/mp4';
+            videoSource.src = url;
+            videoElement.load();
+        }
+    }
+    
     function updateHeadlines(news) {
         headlinesContainer.innerHTML = '';
         headlinesContainer.classList.toggle('rtl', currentLanguage === 'urdu');
@@ -171,8 +191,7 @@ document.addEventListener('DOMContentLoaded', function() {
                             clearInterval(pollInterval);
                             
                             // Update video source
-                            videoSource.src = data.video_url;
-                            videoElement.load();
+                            loadVideo(data.video_url);
                             
                             // Update headlines
                             updateHeadlines(data.news);